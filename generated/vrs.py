@@ -6,7 +6,7 @@ from pydantic import BaseModel as BaseModel, Field
 from linkml_runtime.linkml_model import Decimal
 
 metamodel_version = "None"
-version = "None"
+version = "0.1.0"
 
 
 class WeakRefShimBaseModel(BaseModel):